@@ -9,21 +9,21 @@ from test_framework.test_framework import BitcoinTestFramework
 
 class DeprecatedRpcTest(BitcoinTestFramework):
     def set_test_params(self):
-        self.num_nodes = 2
+        self.num_nodes = 1
         self.setup_clean_chain = True
-        self.extra_args = [[], []]
+        self.extra_args = [[]]
 
     def run_test(self):
         # This test should be used to verify correct behaviour of deprecated
         # RPC methods with and without the -deprecatedrpc flags. For example:
         #
-        # In set_test_params:
-        # self.extra_args = [[], ["-deprecatedrpc=generate"]]
-        #
-        # In run_test:
         # self.log.info("Test generate RPC")
         # assert_raises_rpc_error(-32, 'The wallet generate rpc method is deprecated', self.nodes[0].rpc.generate, 1)
-        # self.nodes[1].generate(1)
+        # self.restart_node(0, extra_args=["-deprecatedrpc=generate"])
+        # self.nodes[0].generate(1)
+        #
+        # Restarting the single node with the -deprecatedrpc flag is cheaper
+        # than starting a second node just to toggle it.
         self.log.info("No tested deprecated RPC methods")
 
 